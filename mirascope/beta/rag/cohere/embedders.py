@@ -1,6 +1,6 @@
 """A module for calling OpenAI's Embeddings models."""
 
-import datetime
+import time
 from typing import ClassVar
 
 from cohere import AsyncClient, Client
@@ -51,12 +51,12 @@ class CohereEmbedder(BaseEmbedder[CohereEmbeddingResponse]):
             if self.embedding_params.embedding_types
             else None
         )
-        start_time = datetime.datetime.now().timestamp() * 1000
+        start_time = time.time() * 1000
         response = co.embed(texts=inputs, **self.embedding_params.kwargs())
         return CohereEmbeddingResponse(
             response=response,
             start_time=start_time,
-            end_time=datetime.datetime.now().timestamp() * 1000,
+            end_time=time.time() * 1000,
             embedding_type=embedding_type,
         )
 
@@ -68,12 +68,12 @@ class CohereEmbedder(BaseEmbedder[CohereEmbeddingResponse]):
             if self.embedding_params.embedding_types
             else None
         )
-        start_time = datetime.datetime.now().timestamp() * 1000
+        start_time = time.time() * 1000
         response = await co.embed(texts=inputs, **self.embedding_params.kwargs())
         return CohereEmbeddingResponse(
             response=response,
             start_time=start_time,
-            end_time=datetime.datetime.now().timestamp() * 1000,
+            end_time=time.time() * 1000,
             embedding_type=embedding_type,
         )
 
@@ -1,7 +1,7 @@
 """A module for calling OpenAI's Embeddings models."""
 
 import asyncio
-import datetime
+import time
 from concurrent.futures import ThreadPoolExecutor
 from typing import ClassVar
 
@@ -88,12 +88,12 @@ class OpenAIEmbedder(BaseEmbedder[OpenAIEmbeddingResponse]):
         kwargs = self.embedding_params.kwargs()
         if self.embedding_params.model != "text-embedding-ada-002":
             kwargs["dimensions"] = self.dimensions
-        start_time = datetime.datetime.now().timestamp() * 1000
+        start_time = time.time() * 1000
         embeddings = client.embeddings.create(input=inputs, **kwargs)
         return OpenAIEmbeddingResponse(
             response=embeddings,
             start_time=start_time,
-            end_time=datetime.datetime.now().timestamp() * 1000,
+            end_time=time.time() * 1000,
         )
 
     async def _embed_async(self, inputs: list[str]) -> OpenAIEmbeddingResponse:
@@ -102,12 +102,12 @@ class OpenAIEmbedder(BaseEmbedder[OpenAIEmbeddingResponse]):
         kwargs = self.embedding_params.kwargs()
         if self.embedding_params.model != "text-embedding-ada-002":
             kwargs["dimensions"] = self.dimensions
-        start_time = datetime.datetime.now().timestamp() * 1000
+        start_time = time.time() * 1000
         embeddings = await client.embeddings.create(input=inputs, **kwargs)
         return OpenAIEmbeddingResponse(
             response=embeddings,
             start_time=start_time,
-            end_time=datetime.datetime.now().timestamp() * 1000,
+            end_time=time.time() * 1000,
         )
 
     def _merge_batch_embeddings(
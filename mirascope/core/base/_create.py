@@ -1,6 +1,6 @@
 """The `create_factory` method for generating provider specific create decorators."""
 
-import datetime
+import time
 from collections.abc import Awaitable, Callable
 from functools import wraps
 from typing import ParamSpec, TypeVar, cast, overload
@@ -143,9 +143,9 @@ def create_factory(  # noqa: ANN202
                     call_params=call_params,
                     extract=False,
                 )
-                start_time = datetime.datetime.now().timestamp() * 1000
+                start_time = time.time() * 1000
                 response = await create(stream=False, **call_kwargs)
-                end_time = datetime.datetime.now().timestamp() * 1000
+                end_time = time.time() * 1000
                 output = TCallResponse(
                     metadata=get_metadata(fn, dynamic_config),
                     response=response,
@@ -183,9 +183,9 @@ def create_factory(  # noqa: ANN202
                     call_params=call_params,
                     extract=False,
                 )
-                start_time = datetime.datetime.now().timestamp() * 1000
+                start_time = time.time() * 1000
                 response = create(stream=False, **call_kwargs)
-                end_time = datetime.datetime.now().timestamp() * 1000
+                end_time = time.time() * 1000
                 output = TCallResponse(
                     metadata=get_metadata(fn, dynamic_config),
                     response=response,
@@ -22,7 +22,7 @@ from ._is_prompt_template import is_prompt_template
 from ._json_mode_content import json_mode_content
 from ._messages_decorator import MessagesDecorator, messages_decorator
 from ._parse_content_template import parse_content_template
-from ._parse_prompt_messages import parse_prompt_messages
+from ._parse_prompt_messages import PROMPT_ROLES, parse_prompt_messages
 from ._protocols import (
     AsyncCreateFn,
     CalculateCost,
@@ -72,6 +72,7 @@ __all__ = [
     "messages_decorator",
     "parse_content_template",
     "parse_prompt_messages",
+    "PROMPT_ROLES",
     "SetupCall",
     "setup_call",
     "setup_extract_tool",
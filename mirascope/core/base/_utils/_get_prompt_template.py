@@ -3,9 +3,12 @@
 import inspect
 import os
 from collections.abc import Callable
+from functools import lru_cache
 
 from pydantic import BaseModel
 
+_cleandoc = lru_cache(maxsize=256)(inspect.cleandoc)
+
 
 def get_prompt_template(fn: Callable | BaseModel) -> str:
     """Get the metadata from the function and merge with any dynamic metadata."""
@@ -25,4 +28,4 @@ def get_prompt_template(fn: Callable | BaseModel) -> str:
             "You must explicitly enable docstring prompt templates by setting "
             "`MIRASCOPE_DOCSTRING_PROMPT_TEMPLATE=ENABLED` in your environment."
         )
-    return inspect.cleandoc(doc)
+    return _cleandoc(doc)
@@ -1,6 +1,7 @@
 """This module provides a function to parse messages from a prompt template."""
 
 import re
+from collections.abc import Sequence
 from typing import Any, TypeVar
 
 from pydantic import BaseModel
@@ -15,9 +16,11 @@ BaseToolT = TypeVar("BaseToolT", bound=BaseModel)
 _MessageParamT = TypeVar("_MessageParamT", bound=Any)
 _CallParamsT = TypeVar("_CallParamsT", bound=BaseCallParams)
 
+PROMPT_ROLES = ("system", "user", "assistant")
+
 
 def parse_prompt_messages(
-    roles: list[str],
+    roles: Sequence[str],
     template: str,
     attrs: dict[str, Any],
     dynamic_config: BaseDynamicConfig[_MessageParamT, _CallParamsT] = None,
@@ -16,7 +16,7 @@ from ..call_params import BaseCallParams
 from ..dynamic_config import BaseDynamicConfig
 from ..message_param import BaseMessageParam
 from ..tool import BaseTool
-from . import get_prompt_template, parse_prompt_messages
+from . import PROMPT_ROLES, get_prompt_template, parse_prompt_messages
 from ._convert_base_model_to_base_tool import convert_base_model_to_base_tool
 from ._convert_function_to_base_tool import convert_function_to_base_tool
 
@@ -52,7 +52,7 @@ def setup_call(
         prompt_template = get_prompt_template(fn)
         assert prompt_template is not None, "The function must have a prompt template."
         messages = parse_prompt_messages(
-            roles=["system", "user", "assistant"],
+            roles=PROMPT_ROLES,
             template=prompt_template,
             attrs=fn_args,
             dynamic_config=dynamic_config,
@@ -60,12 +60,15 @@ def setup_call(
 
     tool_types = None
     if tools:
-        tool_types = [
-            convert_base_model_to_base_tool(tool, tool_type)
-            if inspect.isclass(tool)
-            else convert_function_to_base_tool(tool, tool_type)
-            for tool in tools
-        ]
-        call_kwargs["tools"] = [tool_type.tool_schema() for tool_type in tool_types]
+        tool_types, tool_schemas = [], []
+        for tool in tools:
+            converted_tool = (
+                convert_base_model_to_base_tool(tool, tool_type)
+                if inspect.isclass(tool)
+                else convert_function_to_base_tool(tool, tool_type)
+            )
+            tool_types.append(converted_tool)
+            tool_schemas.append(converted_tool.tool_schema())
+        call_kwargs["tools"] = tool_schemas
 
     return prompt_template, messages, tool_types, call_kwargs
@@ -16,6 +16,7 @@ from pydantic import BaseModel
 from typing_extensions import TypeIs
 
 from ._utils import (
+    PROMPT_ROLES,
     BaseType,
     MessagesDecorator,
     fn_is_async,
@@ -84,7 +85,7 @@ class BasePrompt(BaseModel):
     def message_params(self) -> list[BaseMessageParam]:
         """Returns the list of parsed message parameters."""
         return parse_prompt_messages(
-            roles=["system", "user", "assistant"],
+            roles=PROMPT_ROLES,
             template=get_prompt_template(self),
             attrs={field: getattr(self, field) for field in self.model_fields},
         )
@@ -414,7 +415,7 @@ def prompt_template(
                 *args: _P.args, **kwargs: _P.kwargs
             ) -> list[BaseMessageParam]:
                 return parse_prompt_messages(
-                    roles=["system", "user", "assistant"],
+                    roles=PROMPT_ROLES,
                     template=template,
                     attrs=get_fn_args(prompt, args, kwargs),
                     dynamic_config=await prompt(*args, **kwargs),
@@ -430,7 +431,7 @@ def prompt_template(
                 *args: _P.args, **kwargs: _P.kwargs
             ) -> list[BaseMessageParam]:
                 return parse_prompt_messages(
-                    roles=["system", "user", "assistant"],
+                    roles=PROMPT_ROLES,
                     template=template,
                     attrs=get_fn_args(prompt, args, kwargs),
                     dynamic_config=prompt(*args, **kwargs),
@@ -1,6 +1,6 @@
 """This module contains the base classes for streaming responses from LLMs."""
 
-import datetime
+import time
 from abc import ABC, abstractmethod
 from collections.abc import AsyncGenerator, Awaitable, Callable, Generator
 from functools import wraps
@@ -140,7 +140,7 @@ class BaseStream(
             self.stream, Generator
         ), "Stream must be a generator for __iter__"
         self.content, tool_calls = "", []
-        self.start_time = datetime.datetime.now().timestamp() * 1000
+        self.start_time = time.time() * 1000
         for chunk, tool in self.stream:
             self._update_properties(chunk)
             if tool:
@@ -148,7 +148,7 @@ class BaseStream(
                 if tool_call != _DEFAULT:
                     tool_calls.append(tool_call)
             yield chunk, tool
-        self.end_time = datetime.datetime.now().timestamp() * 1000
+        self.end_time = time.time() * 1000
         self.message_param = self._construct_message_param(
             tool_calls or None, self.content
         )
@@ -36,7 +36,7 @@ class GenerateJsonSchemaNoTitles(GenerateJsonSchema):
 
     def _remove_title(self, obj: Any) -> Any:  # noqa: ANN401
         if isinstance(obj, dict):
-            if self._openai_strict and "type" in obj and obj["type"] == "object":
+            if self._openai_strict and obj.get("type") == "object":
                 obj["additionalProperties"] = False
             if "type" in obj or "$ref" in obj or "properties" in obj:
                 obj.pop("title", None)
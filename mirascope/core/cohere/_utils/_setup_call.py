@@ -101,8 +101,8 @@ def setup_call(
     messages = convert_message_params(messages)
 
     preamble = ""
-    if "preamble" in call_kwargs and call_kwargs["preamble"] is not None:
-        preamble = call_kwargs.pop("preamble", "") or ""
+    if call_kwargs.get("preamble") is not None:
+        preamble = call_kwargs.pop("preamble") or ""
     if messages[0].role == "SYSTEM":  # pyright: ignore [reportAttributeAccessIssue]
         if preamble:
             preamble += "\n\n"
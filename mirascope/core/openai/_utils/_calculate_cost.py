@@ -1,5 +1,26 @@
 """Calculate the cost of a completion using the OpenAI API."""
 
+# Maps model name to its (prompt, completion) cost per token.
+_PRICING: dict[str, tuple[float, float]] = {
+    "gpt-4o-mini": (0.000_000_15, 0.000_000_6),
+    "gpt-4o-mini-2024-07-18": (0.000_000_15, 0.000_000_6),
+    "gpt-4o": (0.000_005, 0.000_015),
+    "gpt-4o-2024-05-13": (0.000_005, 0.000_015),
+    "gpt-4-turbo": (0.000_01, 0.000_03),
+    "gpt-4-turbo-2024-04-09": (0.000_01, 0.000_03),
+    "gpt-3.5-turbo-0125": (0.000_000_5, 0.000_001_5),
+    "gpt-3.5-turbo-1106": (0.000_001, 0.000_002),
+    "gpt-4-1106-preview": (0.000_01, 0.000_03),
+    "gpt-4": (0.000_003, 0.000_006),
+    "gpt-3.5-turbo-4k": (0.000_015, 0.000_02),
+    "gpt-3.5-turbo-16k": (0.000_003, 0.000_004),
+    "gpt-4-8k": (0.000_003, 0.000_006),
+    "gpt-4-32k": (0.000_006, 0.000_012),
+    "text-embedding-3-small": (0.000_000_02, 0.000_000_02),
+    "text-embedding-ada-002": (0.000_000_1, 0.000_000_1),
+    "text-embedding-3-large": (0.000_000_13, 0.000_000_13),
+}
+
 
 def calculate_cost(
     input_tokens: int | float | None,
@@ -25,86 +46,13 @@ def calculate_cost(
     text-embedding-3-large	$0.13 / 1M tokens
     text-embedding-ada-0002	$0.10 / 1M tokens
     """
-    pricing = {
-        "gpt-4o-mini": {
-            "prompt": 0.000_000_15,
-            "completion": 0.000_000_6,
-        },
-        "gpt-4o-mini-2024-07-18": {
-            "prompt": 0.000_000_15,
-            "completion": 0.000_000_6,
-        },
-        "gpt-4o": {
-            "prompt": 0.000_005,
-            "completion": 0.000_015,
-        },
-        "gpt-4o-2024-05-13": {
-            "prompt": 0.000_005,
-            "completion": 0.000_015,
-        },
-        "gpt-4-turbo": {
-            "prompt": 0.000_01,
-            "completion": 0.000_03,
-        },
-        "gpt-4-turbo-2024-04-09": {
-            "prompt": 0.000_01,
-            "completion": 0.000_03,
-        },
-        "gpt-3.5-turbo-0125": {
-            "prompt": 0.000_000_5,
-            "completion": 0.000_001_5,
-        },
-        "gpt-3.5-turbo-1106": {
-            "prompt": 0.000_001,
-            "completion": 0.000_002,
-        },
-        "gpt-4-1106-preview": {
-            "prompt": 0.000_01,
-            "completion": 0.000_03,
-        },
-        "gpt-4": {
-            "prompt": 0.000_003,
-            "completion": 0.000_006,
-        },
-        "gpt-3.5-turbo-4k": {
-            "prompt": 0.000_015,
-            "completion": 0.000_02,
-        },
-        "gpt-3.5-turbo-16k": {
-            "prompt": 0.000_003,
-            "completion": 0.000_004,
-        },
-        "gpt-4-8k": {
-            "prompt": 0.000_003,
-            "completion": 0.000_006,
-        },
-        "gpt-4-32k": {
-            "prompt": 0.000_006,
-            "completion": 0.000_012,
-        },
-        "text-embedding-3-small": {
-            "prompt": 0.000_000_02,
-            "completion": 0.000_000_02,
-        },
-        "text-embedding-ada-002": {
-            "prompt": 0.000_000_1,
-            "completion": 0.000_000_1,
-        },
-        "text-embedding-3-large": {
-            "prompt": 0.000_000_13,
-            "completion": 0.000_000_13,
-        },
-    }
-    if input_tokens is None or output_tokens is None:
-        return None
-
-    try:
-        model_pricing = pricing[model]
-    except KeyError:
+    model_pricing = _PRICING.get(model)
+    if input_tokens is None or output_tokens is None or model_pricing is None:
         return None
 
-    prompt_cost = input_tokens * model_pricing["prompt"]
-    completion_cost = output_tokens * model_pricing["completion"]
+    prompt_rate, completion_rate = model_pricing
+    prompt_cost = input_tokens * prompt_rate
+    completion_cost = output_tokens * completion_rate
     total_cost = prompt_cost + completion_cost
 
     return total_cost
@@ -77,11 +77,14 @@ class OpenAIStream(
         content: str | None = None,
     ) -> ChatCompletionAssistantMessageParam:
         """Constructs the message parameter for the assistant."""
-        message_param = ChatCompletionAssistantMessageParam(
-            role="assistant", content=content
-        )
-        if tool_calls:
-            message_param["tool_calls"] = [
+        if not tool_calls:
+            return ChatCompletionAssistantMessageParam(
+                role="assistant", content=content
+            )
+        return ChatCompletionAssistantMessageParam(
+            role="assistant",
+            content=content,
+            tool_calls=[
                 ChatCompletionMessageToolCallParam(
                     type="function",
                     function=Function(
@@ -91,8 +94,8 @@ class OpenAIStream(
                     id=tool_call.id,
                 )
                 for tool_call in tool_calls
-            ]
-        return message_param
+            ],
+        )
 
     def construct_call_response(self) -> OpenAICallResponse:
         """Constructs the call response from a consumed OpenAIStream.
@@ -104,18 +107,22 @@ class OpenAIStream(
             raise ValueError(
                 "No stream response, check if the stream has been consumed."
             )
+        message_param = self.message_param
         message = {
-            "role": self.message_param["role"],
-            "content": self.message_param.get("content", ""),
-            "tool_calls": self.message_param.get("tool_calls", []),
+            "role": message_param["role"],
+            "content": message_param.get("content", ""),
         }
-        if not self.input_tokens and not self.output_tokens:
+        if tool_calls := message_param.get("tool_calls"):
+            message["tool_calls"] = tool_calls
+        input_tokens = int(self.input_tokens or 0)
+        output_tokens = int(self.output_tokens or 0)
+        if not input_tokens and not output_tokens:
             usage = None
         else:
             usage = CompletionUsage(
-                prompt_tokens=int(self.input_tokens or 0),
-                completion_tokens=int(self.output_tokens or 0),
-                total_tokens=int(self.input_tokens or 0) + int(self.output_tokens or 0),
+                prompt_tokens=input_tokens,
+                completion_tokens=output_tokens,
+                total_tokens=input_tokens + output_tokens,
             )
         completion = ChatCompletion(
             id=self.id if self.id else "",
@@ -6,15 +6,36 @@ from typing import Any, TypeVar
 
 from pydantic import BaseModel
 
+_DANGEROUS_CLASS_VARS = frozenset({"api_key"})
+
 
 def get_class_vars(self: BaseModel) -> dict[str, Any]:
     """Get the class variables of a `BaseModel` removing any dangerous variables."""
-    class_vars = {}
-    for classvars in self.__class_vars__:
-        if classvars != "api_key":
-            class_vars[classvars] = getattr(self.__class__, classvars)
-    return class_vars
+    cls = type(self)
+    return {
+        name: getattr(cls, name)
+        for name in self.__class_vars__
+        if name not in _DANGEROUS_CLASS_VARS
+    }
+
+
+_IGNORE_FUNCTIONS = frozenset(
+    {
+        "copy",
+        "dict",
+        "dump",
+        "json",
+        "messages",
+        "model_copy",
+        "model_dump",
+        "model_dump_json",
+        "model_post_init",
+    }
+)
 
+_ASYNC_OR_GENERATOR_FLAGS = (
+    inspect.CO_ASYNC_GENERATOR | inspect.CO_COROUTINE | inspect.CO_GENERATOR
+)
 
 F = TypeVar("F", bound=Callable[..., Any])
 DecoratorType = Callable[[F], F]
@@ -30,25 +51,87 @@ def mirascope_span(  # noqa: ANN201
     decorator: DecoratorType | None = None,
     **custom_kwargs: Any,  # noqa: ANN401
 ):
-    """Wraps a pydantic class method."""
+    """Wraps a pydantic class method.
 
-    async def run_after_call_handler(self, result, result_before_call, joined_kwargs):  # noqa: ANN001, ANN202
-        if handle_after_call_async is not None:
-            await handle_after_call_async(
-                self, fn, result, result_before_call, **joined_kwargs
-            )
-        elif handle_after_call is not None:
-            handle_after_call(self, fn, result, result_before_call, **joined_kwargs)
+    The wrapper kind, and whether it runs a before call handler, are resolved once
+    here. The returned wrapper still checks for an after call handler on each call.
+    """
+    flags = _get_code_flags(fn)
+    if flags & inspect.CO_ASYNC_GENERATOR:
+        wrapper_function = _wrap_generator_async(
+            fn,
+            handle_before_call,
+            handle_before_call_async,
+            handle_after_call,
+            handle_after_call_async,
+            custom_kwargs,
+        )
+    elif flags & inspect.CO_COROUTINE:
+        wrapper_function = _wrap_async(
+            fn,
+            handle_before_call,
+            handle_before_call_async,
+            handle_after_call,
+            handle_after_call_async,
+            custom_kwargs,
+        )
+    elif flags & inspect.CO_GENERATOR:
+        wrapper_function = _wrap_generator(
+            fn, handle_before_call, handle_after_call, custom_kwargs
+        )
+    else:
+        wrapper_function = _wrap(
+            fn, handle_before_call, handle_after_call, custom_kwargs
+        )
+    if decorator is not None:
+        wrapper_function = decorator(wrapper_function)
+    return wrapper_function
+
+
+def _get_code_flags(fn: Callable) -> int:
+    """Returns the `inspect.CO_*` flags that decide which wrapper `fn` gets.
+
+    Functions are read straight from `__code__`. Anything without one (e.g. a
+    `functools.partial`) goes through the `inspect` predicates, which unwrap it.
+    """
+    code = getattr(fn, "__code__", None)
+    if code is None:
+        if inspect.isasyncgenfunction(fn):
+            return inspect.CO_ASYNC_GENERATOR
+        elif inspect.iscoroutinefunction(fn):
+            return inspect.CO_COROUTINE
+        elif inspect.isgeneratorfunction(fn):
+            return inspect.CO_GENERATOR
+        return 0
+    flags = code.co_flags
+    if not flags & _ASYNC_OR_GENERATOR_FLAGS and inspect.iscoroutinefunction(fn):
+        # A plain function marked with `inspect.markcoroutinefunction`
+        return flags | inspect.CO_COROUTINE
+    return flags
+
+
+def _wrap(  # noqa: ANN202
+    fn: Callable,
+    handle_before_call: Callable[..., Any] | None,
+    handle_after_call: Callable[..., Any] | None,
+    custom_kwargs: dict[str, Any],
+):
+    """Wraps a pydantic class method that returns a value."""
+    if handle_before_call is None:
+
+        @wraps(fn)
+        def wrapper(self: BaseModel, *args: Any, **kwargs: Any):  # noqa: ANN202, ANN401
+            result = fn(self, *args, **kwargs)
+            if handle_after_call is not None:
+                handle_after_call(self, fn, result, None, **{**kwargs, **custom_kwargs})
+            return result
+
+        return wrapper
 
     @wraps(fn)
-    def wrapper(self: BaseModel, *args: Any, **kwargs: Any):  # noqa: ANN202, ANN401
-        """Wraps a pydantic class method that returns a value."""
+    def wrapper_with_before(self: BaseModel, *args: Any, **kwargs: Any):  # noqa: ANN202, ANN401
         joined_kwargs = {**kwargs, **custom_kwargs}
-        before_call = (
-            handle_before_call(self, fn, **joined_kwargs)
-            if handle_before_call is not None
-            else None
-        )
+        before_call = handle_before_call(self, fn, **joined_kwargs)
         if isinstance(before_call, AbstractContextManager):
             with before_call as result_before_call:
                 result = fn(self, *args, **kwargs)
@@ -57,49 +140,94 @@ def mirascope_span(  # noqa: ANN201
                         self, fn, result, result_before_call, **joined_kwargs
                     )
                 return result
-        else:
-            result = fn(self, *args, **kwargs)
-            if handle_after_call is not None:
-                handle_after_call(self, fn, result, before_call, **joined_kwargs)
+        result = fn(self, *args, **kwargs)
+        if handle_after_call is not None:
+            handle_after_call(self, fn, result, before_call, **joined_kwargs)
+        return result
+
+    return wrapper_with_before
+
+
+def _wrap_async(  # noqa: ANN202
+    fn: Callable,
+    handle_before_call: Callable[..., Any] | None,
+    handle_before_call_async: Callable[..., Awaitable[Any]] | None,
+    handle_after_call: Callable[..., Any] | None,
+    handle_after_call_async: Callable[..., Awaitable[Any]] | None,
+    custom_kwargs: dict[str, Any],
+):
+    """Wraps a pydantic async class method that returns a value."""
+    run_after_call_handler = _get_after_call_handler_async(
+        fn, handle_after_call, handle_after_call_async
+    )
+    if handle_before_call is None and handle_before_call_async is None:
+
+        @wraps(fn)
+        async def wrapper_async(self: BaseModel, *args: Any, **kwargs: Any):  # noqa: ANN202, ANN401
+            result = await fn(self, *args, **kwargs)
+            if run_after_call_handler is not None:
+                await run_after_call_handler(
+                    self, result, None, {**kwargs, **custom_kwargs}
+                )
             return result
 
+        return wrapper_async
+
     @wraps(fn)
-    async def wrapper_async(self: BaseModel, *args: Any, **kwargs: Any):  # noqa: ANN202, ANN401
-        """Wraps a pydantic async class method that returns a value."""
+    async def wrapper_async_with_before(self: BaseModel, *args: Any, **kwargs: Any):  # noqa: ANN202, ANN401
         joined_kwargs = {**kwargs, **custom_kwargs}
-        before_call = None
         if handle_before_call_async is not None:
             before_call = await handle_before_call_async(self, fn, **joined_kwargs)
-        elif handle_before_call is not None:
-            before_call = handle_before_call(self, fn, **joined_kwargs)
-
+        else:
+            before_call = handle_before_call(self, fn, **joined_kwargs)  # pyright: ignore [reportOptionalCall]
         if isinstance(before_call, AbstractContextManager):
             with before_call as result_before_call:
                 result = await fn(self, *args, **kwargs)
-                await run_after_call_handler(
-                    self, result, result_before_call, joined_kwargs
-                )
+                if run_after_call_handler is not None:
+                    await run_after_call_handler(
+                        self, result, result_before_call, joined_kwargs
+                    )
                 return result
-        else:
-            result = await fn(self, *args, **kwargs)
+        result = await fn(self, *args, **kwargs)
+        if run_after_call_handler is not None:
             await run_after_call_handler(self, result, before_call, joined_kwargs)
-            return result
+        return result
+
+    return wrapper_async_with_before
+
+
+def _wrap_generator(  # noqa: ANN202
+    fn: Callable,
+    handle_before_call: Callable[..., Any] | None,
+    handle_after_call: Callable[..., Any] | None,
+    custom_kwargs: dict[str, Any],
+):
+    """Wraps a pydantic class method that returns a generator."""
+    if handle_before_call is None:
+
+        @wraps(fn)
+        def wrapper_generator(self: BaseModel, *args: Any, **kwargs: Any):  # noqa: ANN202, ANN401
+            output = []
+            append = output.append
+            for value in fn(self, *args, **kwargs):
+                append(value)
+                yield value
+            if handle_after_call is not None:
+                handle_after_call(self, fn, output, None, **{**kwargs, **custom_kwargs})
+
+        return wrapper_generator
 
     @wraps(fn)
-    def wrapper_generator(self: BaseModel, *args: Any, **kwargs: Any):  # noqa: ANN202, ANN401
-        """Wraps a pydantic class method that returns a generator."""
+    def wrapper_generator_with_before(self: BaseModel, *args: Any, **kwargs: Any):  # noqa: ANN202, ANN401
         joined_kwargs = {**kwargs, **custom_kwargs}
-        before_call = (
-            handle_before_call(self, fn, **joined_kwargs)
-            if handle_before_call is not None
-            else None
-        )
+        before_call = handle_before_call(self, fn, **joined_kwargs)
         if isinstance(before_call, AbstractContextManager):
             with before_call as result_before_call:
                 result = fn(self, *args, **kwargs)
                 output = []
+                append = output.append
                 for value in result:
-                    output.append(value)
+                    append(value)
                     yield value
                 if handle_after_call is not None:
                     handle_after_call(
@@ -108,49 +236,111 @@ def mirascope_span(  # noqa: ANN201
         else:
             result = fn(self, *args, **kwargs)
             output = []
+            append = output.append
             for value in result:
-                output.append(value)
+                append(value)
                 yield value
             if handle_after_call is not None:
                 handle_after_call(self, fn, output, before_call, **joined_kwargs)
 
+    return wrapper_generator_with_before
+
+
+def _wrap_generator_async(  # noqa: ANN202
+    fn: Callable,
+    handle_before_call: Callable[..., Any] | None,
+    handle_before_call_async: Callable[..., Awaitable[Any]] | None,
+    handle_after_call: Callable[..., Any] | None,
+    handle_after_call_async: Callable[..., Awaitable[Any]] | None,
+    custom_kwargs: dict[str, Any],
+):
+    """Wraps a pydantic async class method that returns a generator."""
+    run_after_call_handler = _get_after_call_handler_async(
+        fn, handle_after_call, handle_after_call_async
+    )
+    if handle_before_call is None and handle_before_call_async is None:
+
+        @wraps(fn)
+        async def wrapper_generator_async(self: BaseModel, *args: Any, **kwargs: Any):  # noqa: ANN202, ANN401
+            output = []
+            append = output.append
+            async for value in fn(self, *args, **kwargs):
+                append(value)
+                yield value
+            if run_after_call_handler is not None:
+                await run_after_call_handler(
+                    self, output, None, {**kwargs, **custom_kwargs}
+                )
+
+        return wrapper_generator_async
+
     @wraps(fn)
-    async def wrapper_generator_async(self: BaseModel, *args: Any, **kwargs: Any):  # noqa: ANN202, ANN401
-        """Wraps a pydantic async class method that returns a generator."""
+    async def wrapper_generator_async_with_before(  # noqa: ANN202
+        self: BaseModel,
+        *args: Any,  # noqa: ANN401
+        **kwargs: Any,  # noqa: ANN401
+    ):
         joined_kwargs = {**kwargs, **custom_kwargs}
-        before_call = None
         if handle_before_call_async is not None:
             before_call = await handle_before_call_async(self, fn, **joined_kwargs)
-        elif handle_before_call is not None:
-            before_call = handle_before_call(self, fn, **joined_kwargs)
+        else:
+            before_call = handle_before_call(self, fn, **joined_kwargs)  # pyright: ignore [reportOptionalCall]
         if isinstance(before_call, AbstractContextManager):
             with before_call as result_before_call:
                 result = fn(self, *args, **kwargs)
                 output = []
+                append = output.append
                 async for value in result:
-                    output.append(value)
+                    append(value)
                     yield value
-                await run_after_call_handler(
-                    self, output, result_before_call, joined_kwargs
-                )
+                if run_after_call_handler is not None:
+                    await run_after_call_handler(
+                        self, output, result_before_call, joined_kwargs
+                    )
         else:
             result = fn(self, *args, **kwargs)
             output = []
+            append = output.append
             async for value in result:
-                output.append(value)
+                append(value)
                 yield value
-            await run_after_call_handler(self, output, before_call, joined_kwargs)
-
-    wrapper_function = wrapper
-    if inspect.isasyncgenfunction(fn):
-        wrapper_function = wrapper_generator_async
-    elif inspect.iscoroutinefunction(fn):
-        wrapper_function = wrapper_async
-    elif inspect.isgeneratorfunction(fn):
-        wrapper_function = wrapper_generator
-    if decorator is not None:
-        wrapper_function = decorator(wrapper_function)
-    return wrapper_function
+            if run_after_call_handler is not None:
+                await run_after_call_handler(self, output, before_call, joined_kwargs)
+
+    return wrapper_generator_async_with_before
+
+
+def _get_after_call_handler_async(
+    fn: Callable,
+    handle_after_call: Callable[..., Any] | None,
+    handle_after_call_async: Callable[..., Awaitable[Any]] | None,
+) -> Callable[..., Awaitable[None]] | None:
+    """Returns the after call handler to await in async wrappers, if any."""
+    if handle_after_call_async is not None:
+
+        async def run_after_call_handler_async(  # noqa: ANN202
+            self: BaseModel,
+            result: Any,  # noqa: ANN401
+            result_before_call: Any,  # noqa: ANN401
+            joined_kwargs: dict[str, Any],
+        ):
+            await handle_after_call_async(
+                self, fn, result, result_before_call, **joined_kwargs
+            )
+
+        return run_after_call_handler_async
+    elif handle_after_call is not None:
+
+        async def run_after_call_handler(  # noqa: ANN202
+            self: BaseModel,
+            result: Any,  # noqa: ANN401
+            result_before_call: Any,  # noqa: ANN401
+            joined_kwargs: dict[str, Any],
+        ):
+            handle_after_call(self, fn, result, result_before_call, **joined_kwargs)
+
+        return run_after_call_handler
+    return None
 
 
 def wrap_mirascope_class_functions(  # noqa: ANN201
@@ -191,17 +381,13 @@ def wrap_mirascope_class_functions(  # noqa: ANN201
 
 def get_class_functions(cls: type[BaseModel]) -> Generator[str, None, None]:
     """Get the class functions of a `BaseModel`."""
-    ignore_functions = [
-        "copy",
-        "dict",
-        "dump",
-        "json",
-        "messages",
-        "model_copy",
-        "model_dump",
-        "model_dump_json",
-        "model_post_init",
-    ]
-    for name, _ in inspect.getmembers(cls, predicate=inspect.isfunction):
-        if not name.startswith("_") and name not in ignore_functions:
-            yield name
+    seen = set()
+    for base in cls.__mro__:
+        for name, value in vars(base).items():
+            if name in seen or name.startswith("_") or name in _IGNORE_FUNCTIONS:
+                continue
+            seen.add(name)
+            if isinstance(value, staticmethod):
+                value = value.__func__
+            if inspect.isfunction(value):
+                yield name
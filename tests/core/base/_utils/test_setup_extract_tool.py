@@ -2,6 +2,9 @@
 
 from pydantic import BaseModel
 
+from mirascope.core.base._utils._convert_base_model_to_base_tool import (
+    convert_base_model_to_base_tool,
+)
 from mirascope.core.base._utils._setup_extract_tool import setup_extract_tool
 from mirascope.core.base.tool import BaseTool
 
@@ -21,3 +24,17 @@ def test_setup_extract_tool() -> None:
     assert tool_type.__name__ == "str"
     assert tool_type.__base__ == BaseTool
     assert tool_type.__bases__ == (BaseTool,)
+
+
+def test_setup_extract_tool_does_not_affect_tool_conversion() -> None:
+    """Tests that extraction's `call` stub does not leak into converted tools."""
+
+    class Book(BaseModel):
+        title: str
+
+    extract_tool_type = setup_extract_tool(Book, BaseTool)
+    assert extract_tool_type.__abstractmethods__ == frozenset()
+
+    tool_type = convert_base_model_to_base_tool(Book, BaseTool)
+    assert tool_type is not extract_tool_type
+    assert tool_type.__abstractmethods__ == frozenset({"call"})
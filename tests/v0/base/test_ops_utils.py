@@ -0,0 +1,299 @@
+"""Tests the `v0.base.ops_utils` module."""
+
+import inspect
+from collections.abc import AsyncGenerator, Generator
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, ClassVar
+
+import pytest
+from pydantic import BaseModel
+
+from mirascope.v0.base.ops_utils import (
+    get_class_functions,
+    get_class_vars,
+    mirascope_span,
+)
+
+
+class Base(BaseModel):
+    def call(self) -> str:
+        return "call"  # pragma: no cover
+
+    def stream(self) -> str:
+        return "stream"  # pragma: no cover
+
+    def messages(self) -> list:
+        return []  # pragma: no cover
+
+    def _private(self) -> None: ...  # pragma: no cover
+
+
+class Child(Base):
+    prompt_template: ClassVar[str] = "Recommend a book."
+    api_key: ClassVar[str] = "secret"
+
+    def stream(self) -> str:
+        return "child stream"  # pragma: no cover
+
+    async def acall(self) -> str:
+        return "acall"  # pragma: no cover
+
+    @staticmethod
+    def helper() -> str:
+        return "helper"  # pragma: no cover
+
+    @classmethod
+    def build(cls) -> "Child":
+        return cls()  # pragma: no cover
+
+
+def test_get_class_functions() -> None:
+    """Tests that `get_class_functions` finds inherited, overridden and static methods."""
+    assert sorted(get_class_functions(Child)) == ["acall", "call", "helper", "stream"]
+    assert sorted(get_class_functions(Base)) == ["call", "stream"]
+
+
+def test_get_class_vars() -> None:
+    """Tests that `get_class_vars` returns class variables except dangerous ones."""
+
+    class GrandChild(Child):
+        prompt_template: ClassVar[str] = "Recommend a fantasy book."
+
+    assert get_class_vars(Child()) == {"prompt_template": "Recommend a book."}
+    assert get_class_vars(GrandChild()) == {
+        "prompt_template": "Recommend a fantasy book."
+    }
+
+
+@pytest.mark.asyncio
+async def test_mirascope_span_async_partial() -> None:
+    """Tests that a `functools.partial` of a coroutine function is awaited."""
+    results = []
+
+    async def call(self: BaseModel, suffix: str) -> str:
+        return f"call{suffix}"
+
+    def handle_after_call(
+        self: BaseModel, fn: Any, result: Any, before_result: Any, **kwargs: Any
+    ) -> None:
+        results.append(result)
+
+    wrapper = mirascope_span(
+        partial(call, suffix="!"), handle_after_call=handle_after_call
+    )
+    assert inspect.iscoroutinefunction(wrapper)
+    assert await wrapper(Base()) == "call!"
+    assert results == ["call!"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(
+    not hasattr(inspect, "markcoroutinefunction"),
+    reason="`inspect.markcoroutinefunction` requires Python 3.12+",
+)
+async def test_mirascope_span_marked_coroutine_function() -> None:
+    """Tests that a function marked as a coroutine function is awaited."""
+    results = []
+
+    async def _call(self: BaseModel) -> str:
+        return "call"
+
+    def call(self: BaseModel) -> Any:  # noqa: ANN401
+        return _call(self)
+
+    def handle_after_call(
+        self: BaseModel, fn: Any, result: Any, before_result: Any, **kwargs: Any
+    ) -> None:
+        results.append(result)
+
+    wrapper = mirascope_span(
+        inspect.markcoroutinefunction(call),  # pyright: ignore [reportAttributeAccessIssue]
+        handle_after_call=handle_after_call,
+    )
+    assert await wrapper(Base()) == "call"  # pyright: ignore [reportGeneralTypeIssues]
+    assert results == ["call"]
+
+
+class Recorder:
+    """Records the handler calls made by a `mirascope_span` wrapper."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple] = []
+
+    def before(self, self_: BaseModel, fn: Any, **kwargs: Any) -> str:
+        self.calls.append(("before", fn.__name__, kwargs))
+        return "before"
+
+    async def before_async(self, self_: BaseModel, fn: Any, **kwargs: Any) -> str:
+        self.calls.append(("before_async", fn.__name__, kwargs))
+        return "before"
+
+    @contextmanager
+    def before_context(
+        self, self_: BaseModel, fn: Any, **kwargs: Any
+    ) -> Generator[str, None, None]:
+        self.calls.append(("enter", fn.__name__, kwargs))
+        yield "span"
+        self.calls.append(("exit",))
+
+    def after(
+        self, self_: BaseModel, fn: Any, result: Any, before: Any, **kwargs: Any
+    ) -> None:
+        self.calls.append(("after", fn.__name__, result, before, kwargs))
+
+    async def after_async(
+        self, self_: BaseModel, fn: Any, result: Any, before: Any, **kwargs: Any
+    ) -> None:
+        self.calls.append(("after_async", fn.__name__, result, before, kwargs))
+
+
+def sync_call(self: BaseModel, genre: str) -> str:
+    return genre
+
+
+async def async_call(self: BaseModel, genre: str) -> str:
+    return genre
+
+
+def sync_stream(self: BaseModel, genre: str) -> Generator[str, None, None]:
+    yield from genre.split()
+
+
+async def async_stream(self: BaseModel, genre: str) -> AsyncGenerator[str, None]:
+    for chunk in genre.split():
+        yield chunk
+
+
+async def _run(wrapper: Any, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+    """Runs `wrapper` to completion whatever kind of wrapper it is."""
+    result = wrapper(*args, **kwargs)
+    if inspect.isasyncgen(result):
+        return [chunk async for chunk in result]
+    elif inspect.isgenerator(result):
+        return list(result)
+    elif inspect.isawaitable(result):
+        return await result
+    return result
+
+
+FNS_AND_RESULTS = [
+    (sync_call, "fantasy book"),
+    (async_call, "fantasy book"),
+    (sync_stream, ["fantasy", "book"]),
+    (async_stream, ["fantasy", "book"]),
+]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("fn,expected", FNS_AND_RESULTS)
+async def test_mirascope_span_without_handlers(fn: Any, expected: Any) -> None:
+    """Tests the lean wrappers when no handlers are given."""
+    wrapper = mirascope_span(fn)
+    assert wrapper.__name__ == fn.__name__
+    assert await _run(wrapper, Base(), genre="fantasy book") == expected
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("fn,expected", FNS_AND_RESULTS)
+async def test_mirascope_span_after_call_only(fn: Any, expected: Any) -> None:
+    """Tests the lean wrappers that skip the before call handler."""
+    recorder = Recorder()
+    wrapper = mirascope_span(fn, handle_after_call=recorder.after, tags=["a"])
+    assert await _run(wrapper, Base(), genre="fantasy book") == expected
+    assert recorder.calls == [
+        (
+            "after",
+            fn.__name__,
+            expected,
+            None,
+            {"genre": "fantasy book", "tags": ["a"]},
+        )
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("fn,expected", FNS_AND_RESULTS)
+async def test_mirascope_span_with_before_call(fn: Any, expected: Any) -> None:
+    """Tests the wrappers that run a before call handler."""
+    recorder = Recorder()
+    wrapper = mirascope_span(
+        fn,
+        handle_before_call=recorder.before,
+        handle_after_call=recorder.after,
+        tags=["a"],
+    )
+    joined_kwargs = {"genre": "fantasy book", "tags": ["a"]}
+    assert await _run(wrapper, Base(), genre="fantasy book") == expected
+    assert recorder.calls == [
+        ("before", fn.__name__, joined_kwargs),
+        ("after", fn.__name__, expected, "before", joined_kwargs),
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("fn,expected", FNS_AND_RESULTS)
+async def test_mirascope_span_with_before_call_only(fn: Any, expected: Any) -> None:
+    """Tests the wrappers that run a before call handler but no after call handler."""
+    recorder = Recorder()
+    wrapper = mirascope_span(fn, handle_before_call=recorder.before)
+    assert await _run(wrapper, Base(), genre="fantasy book") == expected
+    assert recorder.calls == [("before", fn.__name__, {"genre": "fantasy book"})]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("fn,expected", FNS_AND_RESULTS)
+async def test_mirascope_span_with_before_call_context(fn: Any, expected: Any) -> None:
+    """Tests that a context manager before call handler wraps the call."""
+    recorder = Recorder()
+    wrapper = mirascope_span(
+        fn, handle_before_call=recorder.before_context, handle_after_call=recorder.after
+    )
+    joined_kwargs = {"genre": "fantasy book"}
+    assert await _run(wrapper, Base(), genre="fantasy book") == expected
+    assert recorder.calls == [
+        ("enter", fn.__name__, joined_kwargs),
+        ("after", fn.__name__, expected, "span", joined_kwargs),
+        ("exit",),
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("fn,expected", FNS_AND_RESULTS[1::2])
+async def test_mirascope_span_async_handlers(fn: Any, expected: Any) -> None:
+    """Tests that async wrappers await the async handlers over the sync ones."""
+    recorder = Recorder()
+    joined_kwargs = {"genre": "fantasy book"}
+
+    wrapper = mirascope_span(
+        fn,
+        handle_before_call=recorder.before,
+        handle_before_call_async=recorder.before_async,
+        handle_after_call=recorder.after,
+        handle_after_call_async=recorder.after_async,
+    )
+    assert await _run(wrapper, Base(), genre="fantasy book") == expected
+    assert recorder.calls == [
+        ("before_async", fn.__name__, joined_kwargs),
+        ("after_async", fn.__name__, expected, "before", joined_kwargs),
+    ]
+
+    recorder.calls.clear()
+    wrapper = mirascope_span(fn, handle_after_call_async=recorder.after_async)
+    assert await _run(wrapper, Base(), genre="fantasy book") == expected
+    assert recorder.calls == [
+        ("after_async", fn.__name__, expected, None, joined_kwargs),
+    ]
+
+
+def test_mirascope_span_decorator() -> None:
+    """Tests that `decorator` is applied to the returned wrapper."""
+    decorated = []
+
+    def decorator(fn: Any) -> Any:  # noqa: ANN401
+        decorated.append(fn)
+        return fn
+
+    wrapper = mirascope_span(sync_call, decorator=decorator)
+    assert decorated == [wrapper]
+    assert wrapper(Base(), genre="fantasy") == "fantasy"